@@ -1,4 +1,4 @@
- """
+"""
 YouTube Playlist Transcript Automation Tool
 Purpose: Bulk transcript extraction for technical certification study workflow
 Developed during CCNA preparation to automate video content indexing
@@ -6,30 +6,83 @@ Author: Andriy Karp
 
 """
 
+import argparse
+import asyncio
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
+import random
 import re
+import threading
 import time
+from collections import namedtuple
 from dataclasses import dataclass
-from typing import Optional
+from operator import attrgetter
+from typing import Callable, Optional, Set
 
-import youtube_transcript_api.formatters as formatters
+import aiofiles
 from dotenv import load_dotenv
-from pytubefix import Playlist
-from youtube_transcript_api import YouTubeTranscriptApi
+from pytubefix import Playlist, YouTube
+from youtube_transcript_api import (
+    IpBlocked,
+    NoTranscriptFound,
+    RequestBlocked,
+    TranscriptsDisabled,
+    VideoUnavailable,
+    YouTubeTranscriptApi,
+)
 from youtube_transcript_api.proxies import WebshareProxyConfig
 
+from sqlite_cache import TranscriptCache
+
 # Load environment variables
 load_dotenv()
 
-# Configure logging
+# Configure logging; records pass through a queue so emitting threads
+# and coroutines never block on file I/O
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.FileHandler("transcript_download.log"),
+    logging.StreamHandler(),
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(levelname)s - %(message)s",
-    handlers=[logging.FileHandler("transcript_download.log"), logging.StreamHandler()],
+    handlers=[logging.handlers.QueueHandler(_log_queue)],
 )
 logger = logging.getLogger(__name__)
 
+# Patterns compiled once at import time - these run on hot per-video paths
+_PLAYLIST_RE = re.compile(
+    r"(https?://)?(www\.)?(youtube\.com/playlist\?list=|youtu\.be/)[\w-]+"
+)
+_ILLEGAL_CHARS_RE = re.compile(r'[\\/*?:"<>|]')
+
+# Matches "Retry-After: 30"-style hints in exception messages
+_RETRY_AFTER_RE = re.compile(r"[Rr]etry.[Aa]fter\D*(\d+)")
+
+# Extracts the video ID from saved "[video_id] - title.txt" filenames
+_VIDEO_ID_PREFIX_RE = re.compile(r"\[([\w-]+)\]")
+
+# Extracts the video ID from a watch URL
+_WATCH_URL_RE = re.compile(r"v=([\w-]+)")
+
+# Buffer size for transcript writes
+_WRITE_BUFFER_SIZE = 1 << 16
+
+# Snippet text accessor; avoids a bound-attribute lookup per segment
+# on transcripts with thousands of snippets
+_SNIPPET_TEXT = attrgetter("text")
+
+# Lightweight stand-in for pytubefix video objects; title may be None
+# until resolved lazily on first download
+VideoRef = namedtuple("VideoRef", "video_id title")
+
 
 class Config:
     """Configuration management for transcript downloader."""
@@ -40,7 +93,14 @@ class Config:
     )
     OUTPUT_FOLDER = os.getenv("OUTPUT_FOLDER", "transcripts")
     RETRY_ATTEMPTS = int(os.getenv("RETRY_ATTEMPTS", "3"))
-    RATE_LIMIT_DELAY = float(os.getenv("RATE_LIMIT_DELAY", "0.5"))
+    RATE_LIMIT_RPS = float(os.getenv("RATE_LIMIT_RPS", "2.0"))
+    MAX_CONCURRENCY = int(os.getenv("MAX_CONCURRENCY", "8"))
+    MAX_BACKOFF = float(os.getenv("MAX_BACKOFF", "30.0"))
+    JITTER_MS = float(os.getenv("JITTER_MS", "1000"))
+
+    # Cache configuration
+    CACHE_PATH = os.getenv("CACHE_PATH", "transcript_cache.db")
+    CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", "86400"))
 
     # Proxy configuration (optional)
     USE_PROXY = os.getenv("USE_PROXY", "false").lower() in ("true", "1", "yes")
@@ -48,6 +108,98 @@ class Config:
     PROXY_PASS = os.getenv("PROXY_PASS")
 
 
+class RateLimiter:
+    """
+    Global request rate limiter shared across all fetch tasks.
+
+    Enforces a minimum spacing of 1/rps seconds between consecutive
+    requests regardless of which task issues them, so the aggregate
+    request rate stays at the configured ceiling.
+    """
+
+    def __init__(self, rps: float):
+        self._interval = 1.0 / rps
+        self._lock = asyncio.Lock()
+        self._last_send = 0.0
+
+    async def acquire(self):
+        """Wait until the next request slot is available."""
+        async with self._lock:
+            now = time.monotonic()
+            wait = self._last_send + self._interval - now
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._last_send = time.monotonic()
+
+
+class AdaptiveConcurrency:
+    """
+    Concurrency gate that ramps up gradually and backs off on throttling.
+
+    Starts with a single slot and doubles the allowance after each
+    ramp_interval seconds of throttle-free operation, up to max_slots.
+    A rate-limit signal halves the allowance and pauses new
+    acquisitions for cooldown seconds, so a cold start never provokes
+    the burst-429 pattern that costs more wall time than the ramp.
+    """
+
+    def __init__(
+        self, max_slots: int, ramp_interval: float = 30.0, cooldown: float = 10.0
+    ):
+        self._max = max_slots
+        self._ramp_interval = ramp_interval
+        self._cooldown = cooldown
+        self.slots = 1
+        self._in_flight = 0
+        self._pause_until = 0.0
+        self._last_change = time.monotonic()
+        self._cond = asyncio.Condition()
+
+    def _maybe_ramp(self, now: float):
+        if self.slots < self._max and now - self._last_change >= self._ramp_interval:
+            self.slots = min(self.slots * 2, self._max)
+            self._last_change = now
+            logger.info("Concurrency ramped up to %d", self.slots)
+
+    async def acquire(self):
+        """Wait for a download slot, honoring any cooldown pause."""
+        while True:
+            pause = self._pause_until - time.monotonic()
+            if pause > 0:
+                await asyncio.sleep(pause)
+                continue
+            async with self._cond:
+                self._maybe_ramp(time.monotonic())
+                if self._in_flight < self.slots:
+                    self._in_flight += 1
+                    return
+                await self._cond.wait()
+
+    async def release(self):
+        """Return a slot and wake waiters (more of them after a ramp)."""
+        async with self._cond:
+            self._in_flight -= 1
+            self._maybe_ramp(time.monotonic())
+            self._cond.notify(max(1, self.slots - self._in_flight))
+
+    def on_429(self):
+        """
+        Record a throttling event: halve the allowance and pause.
+
+        Safe to call from executor threads; in-flight tasks above the
+        new allowance simply drain without being cancelled.
+        """
+        now = time.monotonic()
+        self.slots = max(1, self.slots // 2)
+        self._last_change = now
+        self._pause_until = now + self._cooldown
+        logger.warning(
+            "Rate limited: concurrency reduced to %d, pausing %.0fs",
+            self.slots,
+            self._cooldown,
+        )
+
+
 @dataclass
 class DownloadStats:
     """Track download statistics and success metrics."""
@@ -57,19 +209,32 @@ class DownloadStats:
     skipped: int = 0
     failed: int = 0
 
+    def __post_init__(self):
+        self._lock = threading.Lock()
+
+    def increment(self, counter: str):
+        """Thread-safe increment of 'success', 'skipped' or 'failed'."""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
     def print_summary(self):
         """Display formatted summary of download results."""
-        logger.info(f"\n{'=' * 60}")
-        logger.info("DOWNLOAD SUMMARY:")
-        logger.info(f"  Total Videos:  {self.total}")
-        logger.info(f"  Successful:    {self.success}")
-        logger.info(f"  Skipped:       {self.skipped}")
-        logger.info(f"  Failed:        {self.failed}")
+        lines = [
+            "\n" + "=" * 60,
+            "DOWNLOAD SUMMARY:",
+            f"  Total Videos:  {self.total}",
+            f"  Successful:    {self.success}",
+            f"  Skipped:       {self.skipped}",
+            f"  Failed:        {self.failed}",
+        ]
         if self.total > 0:
             success_rate = ((self.success + self.skipped) / self.total) * 100
-            logger.info(f"  Success Rate:  {success_rate:.1f}%")
-        logger.info(f"  Output:        ./{Config.OUTPUT_FOLDER}/")
-        logger.info(f"{'=' * 60}")
+            lines.append(f"  Success Rate:  {success_rate:.1f}%")
+        lines.append(f"  Output:        ./{Config.OUTPUT_FOLDER}/")
+        lines.append("=" * 60)
+
+        # One record, one lock acquisition, one flush
+        logger.info("%s", "\n".join(lines))
 
 
 def validate_playlist_url(url: str) -> str:
@@ -85,8 +250,7 @@ def validate_playlist_url(url: str) -> str:
     Raises:
         ValueError: If URL format is invalid
     """
-    pattern = r"(https?://)?(www\.)?(youtube\.com/playlist\?list=|youtu\.be/)[\w-]+"
-    if not re.match(pattern, url):
+    if not _PLAYLIST_RE.match(url):
         raise ValueError(f"Invalid playlist URL format: {url}")
     return url
 
@@ -102,19 +266,74 @@ def sanitize_filename(title: str) -> str:
         Sanitized filename safe for all operating systems
     """
     # Remove illegal characters for Windows/macOS/Linux filesystems
-    return re.sub(r'[\\/*?:"<>|]', "_", title)
+    return _ILLEGAL_CHARS_RE.sub("_", title)
+
+
+def _is_rate_limited(e: Exception) -> bool:
+    """Best-effort check for a throttling-style failure."""
+    if isinstance(e, (IpBlocked, RequestBlocked)):
+        return True
+    message = str(e).lower()
+    return "429" in message or "too many requests" in message
+
+
+def resolve_video_title(video_id: str) -> str:
+    """
+    Resolve a video title with a single pytubefix lookup.
+
+    Args:
+        video_id: YouTube video ID
+
+    Returns:
+        The video title, or the video ID if the lookup fails
+    """
+    try:
+        return YouTube(f"https://www.youtube.com/watch?v={video_id}").title
+    except Exception:
+        return video_id
+
+
+def scan_existing_ids(output_folder: str) -> Set[str]:
+    """
+    Collect video IDs of transcripts already saved in the output folder.
+
+    One os.scandir sweep replaces a per-video os.path.exists stat call.
+
+    Args:
+        output_folder: Directory containing saved transcripts
+
+    Returns:
+        Set of video IDs with an existing transcript file
+    """
+    existing_ids = set()
+    for entry in os.scandir(output_folder):
+        match = _VIDEO_ID_PREFIX_RE.match(entry.name)
+        if match:
+            existing_ids.add(match.group(1))
+    return existing_ids
 
 
 def fetch_transcript_with_retry(
-    yt_api: YouTubeTranscriptApi, video_id: str, max_retries: int = None
+    yt_api: YouTubeTranscriptApi,
+    video_id: str,
+    max_retries: Optional[int] = None,
+    cache: Optional[TranscriptCache] = None,
+    on_rate_limited: Optional[Callable[[], None]] = None,
 ) -> Optional[list]:
     """
     Fetch transcript with exponential backoff retry logic.
 
+    Runs synchronously; the async pipeline dispatches it to an
+    executor thread. Cache reads happen in the caller so a hit never
+    reaches this function.
+
     Args:
         yt_api: Configured YouTubeTranscriptApi instance
         video_id: YouTube video ID
         max_retries: Maximum number of retry attempts (defaults to Config.RETRY_ATTEMPTS)
+        cache: Optional transcript cache updated with fetched transcripts
+        on_rate_limited: Optional callback invoked when a throttling
+            failure is detected
 
     Returns:
         Transcript data or None if all attempts fail
@@ -125,22 +344,52 @@ def fetch_transcript_with_retry(
     for attempt in range(max_retries):
         try:
             # Try English first (manual or auto-generated)
-            return yt_api.fetch(video_id, languages=["en", "en-US"])
+            transcript_data = yt_api.fetch(video_id, languages=["en", "en-US"])
+            if cache is not None:
+                cache.set_transcript(video_id, transcript_data)
+            return transcript_data
+        except (TranscriptsDisabled, VideoUnavailable) as e:
+            # Permanent condition - retrying cannot succeed
+            logger.error("  ✗ %s: transcript permanently unavailable", type(e).__name__)
+            return None
+        except NoTranscriptFound:
+            # No English track - fall back to whatever language exists
+            try:
+                transcript_data = yt_api.fetch(video_id)
+                if cache is not None:
+                    cache.set_transcript(video_id, transcript_data)
+                return transcript_data
+            except Exception:
+                logger.error("  ✗ No transcript available in any language")
+                return None
         except Exception as e:
+            if on_rate_limited is not None and _is_rate_limited(e):
+                on_rate_limited()
+
             if attempt == max_retries - 1:
-                # Final attempt - try generic fetch
-                try:
-                    return yt_api.fetch(video_id)
-                except Exception:
-                    logger.error(
-                        f"  ✗ No transcript available after {max_retries} attempts"
-                    )
-                    return None
-
-            # Exponential backoff: 1s, 2s, 4s
-            wait_time = 2**attempt
+                logger.error("  ✗ Giving up after %d attempts", max_retries)
+                return None
+
+            # Exponential backoff with jitter so throttled workers
+            # don't retry in lockstep; honor Retry-After when present
+            wait_time = min(
+                Config.MAX_BACKOFF,
+                2**attempt + random.uniform(0, Config.JITTER_MS / 1000),
+            )
+            retry_after = getattr(e, "retry_after", None)
+            if retry_after is None:
+                match = _RETRY_AFTER_RE.search(str(e))
+                if match:
+                    retry_after = match.group(1)
+            if retry_after is not None:
+                wait_time = min(Config.MAX_BACKOFF, float(retry_after))
+
             logger.warning(
-                f"  Retry {attempt + 1}/{max_retries} after {wait_time}s: {str(e)[:50]}"
+                "  Retry %d/%d after %.1fs: %.50s",
+                attempt + 1,
+                max_retries,
+                wait_time,
+                e,
             )
             time.sleep(wait_time)
 
@@ -171,7 +420,7 @@ def initialize_api() -> Optional[YouTubeTranscriptApi]:
             logger.info("✓ API initialized with proxy configuration")
             return yt_api
         except Exception as e:
-            logger.error(f"✗ Error configuring proxy: {e}")
+            logger.error("✗ Error configuring proxy: %s", e)
             return None
     else:
         # Initialize without proxy
@@ -182,130 +431,285 @@ def initialize_api() -> Optional[YouTubeTranscriptApi]:
         return YouTubeTranscriptApi()
 
 
-def fetch_playlist(url: str) -> Optional[Playlist]:
+def _video_ref_from_url(url: str) -> Optional[VideoRef]:
+    """Build a VideoRef from a watch URL, or None if no ID is found."""
+    match = _WATCH_URL_RE.search(str(url))
+    if match:
+        return VideoRef(match.group(1), None)
+    return None
+
+
+# Marks exhaustion of the playlist iterator inside the executor
+_ITER_DONE = object()
+
+
+async def produce_video_refs(
+    url: str, queue: asyncio.Queue, cache: Optional[TranscriptCache] = None
+):
     """
-    Fetch YouTube playlist and validate.
+    Enumerate a playlist and stream VideoRef entries onto a queue.
 
-    Args:
-        url: YouTube playlist URL
+    Pages of watch URLs are pulled in an executor thread, so consumers
+    start downloading transcripts while later pages are still being
+    fetched. A None sentinel marks the end of the playlist.
 
-    Returns:
-        Playlist object or None if fetch fails
+    Args:
+        url: Validated YouTube playlist URL
+        queue: Queue consumed by the download dispatcher
+        cache: Optional cache consulted before enumerating the playlist
     """
     try:
-        validated_url = validate_playlist_url(url)
-        logger.info(f"Fetching playlist from: {validated_url}")
-        playlist = Playlist(validated_url)
-        logger.info(f"✓ Found {len(playlist.videos)} videos in playlist")
-        return playlist
-    except ValueError as e:
-        logger.error(f"✗ {e}")
-        return None
+        if cache is not None:
+            cached = cache.get_playlist(url)
+            if cached is not None:
+                logger.info("✓ Loaded %d videos from playlist cache", len(cached))
+                for entry in cached:
+                    await queue.put(VideoRef(*entry))
+                return
+
+        logger.info("Fetching playlist from: %s", url)
+        loop = asyncio.get_running_loop()
+        playlist = Playlist(url)
+
+        # Parse IDs out of the watch URLs instead of materializing
+        # playlist.videos, which costs one HTTPS round trip per video
+        # just to learn titles we may never need
+        videos = []
+        url_iter = iter(playlist.video_urls)
+        while True:
+            video_url = await loop.run_in_executor(None, next, url_iter, _ITER_DONE)
+            if video_url is _ITER_DONE:
+                break
+            ref = _video_ref_from_url(video_url)
+            if ref is not None:
+                videos.append(ref)
+                await queue.put(ref)
+        logger.info("✓ Found %d videos in playlist", len(videos))
+
+        if cache is not None:
+            cache.set_playlist(url, [tuple(v) for v in videos])
     except Exception as e:
-        logger.error(f"✗ Error fetching playlist: {e}")
-        return None
-
-
-def process_video(
-    yt_api: YouTubeTranscriptApi, video, index: int, total: int, output_folder: str
-) -> bool:
+        logger.error("✗ Error fetching playlist: %s", e)
+    finally:
+        await queue.put(None)
+
+
+async def process_video(
+    yt_api: YouTubeTranscriptApi,
+    video,
+    index: int,
+    stats: DownloadStats,
+    output_folder: str,
+    limiter: RateLimiter,
+    gate: AdaptiveConcurrency,
+    existing_ids: Set[str],
+    cache: Optional[TranscriptCache] = None,
+) -> str:
     """
     Process a single video: fetch transcript, format, and save.
 
+    The concurrency gate bounds how many videos are in flight at once;
+    the sync library calls run in executor threads so the event loop
+    stays responsive.
+
     Args:
         yt_api: Configured YouTube API instance
         video: Video object from playlist
         index: Current video number (1-indexed)
-        total: Total number of videos
+        stats: Statistics tracker; total grows while enumeration runs
         output_folder: Directory to save transcripts
+        limiter: Shared rate limiter gating outbound requests
+        gate: Adaptive gate bounding concurrent downloads
+        existing_ids: Video IDs already present in the output folder
+        cache: Optional transcript cache to avoid repeat downloads
 
     Returns:
-        True if successful, False otherwise
+        One of "success", "skipped" or "failed"
     """
+    await gate.acquire()
     try:
+        loop = asyncio.get_running_loop()
         video_id = video.video_id
-        title = sanitize_filename(video.title)
-        filename = f"[{video_id}] - {title}.txt"
-        output_path = os.path.join(output_folder, filename)
 
         # Check if already processed
-        if os.path.exists(output_path):
-            logger.info(f"[{index}/{total}] Skipping (exists): {title[:50]}...")
-            return True
+        if video_id in existing_ids:
+            logger.info("[%d/%d] Skipping (exists): %s", index, stats.total, video_id)
+            return "skipped"
 
-        logger.info(f"[{index}/{total}] Processing: {title[:50]}...")
+        logger.info("[%d/%d] Processing: %s", index, stats.total, video_id)
 
-        # Fetch transcript with retry logic
-        transcript_data = fetch_transcript_with_retry(yt_api, video_id)
+        # Cache hit avoids the rate limiter and the executor hop
+        transcript_data = None
+        if cache is not None:
+            transcript_data = cache.get_transcript(video_id)
 
         if transcript_data is None:
-            return False
+            await limiter.acquire()
+            transcript_data = await loop.run_in_executor(
+                None,
+                fetch_transcript_with_retry,
+                yt_api,
+                video_id,
+                None,
+                cache,
+                gate.on_429,
+            )
 
-        # Format and save transcript
-        formatted_text = formatters.TextFormatter().format_transcript(transcript_data)
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(formatted_text)
+        if transcript_data is None:
+            return "failed"
 
-        logger.info("  ✓ Saved successfully")
+        # Enumeration no longer fetches titles; resolve on demand
+        title = video.title
+        if title is None:
+            title = await loop.run_in_executor(None, resolve_video_title, video_id)
+        title = sanitize_filename(title)
+        filename = f"[{video_id}] - {title}.txt"
+        output_path = os.path.join(output_folder, filename)
 
-        # Rate limiting - be polite to API
-        time.sleep(Config.RATE_LIMIT_DELAY)
-        return True
+        # Stream segments straight to disk instead of materializing the
+        # whole formatted transcript in memory first; the async write
+        # still overlaps other in-flight fetches
+        async with aiofiles.open(
+            output_path, "w", encoding="utf-8", buffering=_WRITE_BUFFER_SIZE
+        ) as f:
+            await f.writelines(
+                text + "\n" for text in map(_SNIPPET_TEXT, transcript_data)
+            )
+
+        logger.info("  ✓ Saved successfully")
+        return "success"
 
     except Exception as e:
-        logger.error(f"[{index}/{total}] ✗ Error: {str(e)[:80]}")
-        return False
+        logger.error("[%d/%d] ✗ Error: %.80s", index, stats.total, e)
+        return "failed"
+
+    finally:
+        await gate.release()
+
+
+async def download_all(
+    yt_api: YouTubeTranscriptApi,
+    playlist_url: str,
+    stats: DownloadStats,
+    existing_ids: Set[str],
+    cache: Optional[TranscriptCache] = None,
+):
+    """
+    Enumerate the playlist and download transcripts concurrently.
+
+    Playlist enumeration runs as a producer task feeding a bounded
+    queue, so the first transcript fetches start while later playlist
+    pages are still in flight.
+
+    Args:
+        yt_api: Configured YouTube API instance
+        playlist_url: Validated playlist URL to enumerate
+        stats: Statistics tracker updated with each outcome
+        existing_ids: Video IDs already present in the output folder
+        cache: Optional transcript cache to avoid repeat downloads
+    """
+    limiter = RateLimiter(rps=Config.RATE_LIMIT_RPS)
+    gate = AdaptiveConcurrency(max_slots=Config.MAX_CONCURRENCY)
+
+    queue = asyncio.Queue(maxsize=32)
+    producer = asyncio.create_task(produce_video_refs(playlist_url, queue, cache))
+
+    tasks = []
+    seen_ids = set()
+    duplicates = 0
+    while True:
+        ref = await queue.get()
+        if ref is None:
+            break
+
+        # Playlists routinely repeat a video (intro/outro links);
+        # schedule each ID once
+        if ref.video_id in seen_ids:
+            duplicates += 1
+            continue
+        seen_ids.add(ref.video_id)
+
+        stats.total += 1
+        tasks.append(
+            asyncio.create_task(
+                process_video(
+                    yt_api,
+                    ref,
+                    stats.total,
+                    stats,
+                    Config.OUTPUT_FOLDER,
+                    limiter,
+                    gate,
+                    existing_ids,
+                    cache,
+                )
+            )
+        )
+
+    await producer
+    if duplicates:
+        logger.info("Skipped %d duplicate playlist entries", duplicates)
+    for outcome in await asyncio.gather(*tasks):
+        stats.increment(outcome)
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Bulk transcript downloader for YouTube playlists"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk transcript/playlist cache",
+    )
+    return parser.parse_args()
 
 
 def main():
     """Main execution function."""
-    logger.info("=" * 60)
-    logger.info("YouTube Playlist Transcript Automation Tool")
-    logger.info("=" * 60)
+    args = parse_args()
+
+    banner = "\n".join(
+        ("=" * 60, "YouTube Playlist Transcript Automation Tool", "=" * 60)
+    )
+    logger.info("%s", banner)
+
+    # Open the on-disk cache unless explicitly disabled
+    cache = None
+    if not args.no_cache:
+        cache = TranscriptCache(Config.CACHE_PATH, Config.CACHE_TTL_SECONDS)
+        logger.info("Cache enabled: ./%s", Config.CACHE_PATH)
 
     # Ensure output directory exists
     os.makedirs(Config.OUTPUT_FOLDER, exist_ok=True)
-    logger.info(f"Output directory: ./{Config.OUTPUT_FOLDER}/")
+    logger.info("Output directory: ./%s/", Config.OUTPUT_FOLDER)
 
     # Initialize API
     yt_api = initialize_api()
     if yt_api is None:
         return
 
-    # Fetch playlist
-    playlist = fetch_playlist(Config.PLAYLIST_URL)
-    if playlist is None:
+    # Validate the playlist URL before any network work
+    try:
+        playlist_url = validate_playlist_url(Config.PLAYLIST_URL)
+    except ValueError as e:
+        logger.error("✗ %s", e)
         return
 
-    # Initialize statistics tracker
-    stats = DownloadStats(total=len(playlist.videos))
+    # Initialize statistics tracker; total grows as enumeration streams
+    stats = DownloadStats()
 
-    # Process each video
+    # Enumeration and downloads overlap - each fetch is an independent
+    # network call consuming refs as the producer finds them
     logger.info("Starting transcript downloads...")
     logger.info("-" * 60)
 
-    for i, video in enumerate(playlist.videos, 1):
-        success = process_video(
-            yt_api, video, i, len(playlist.videos), Config.OUTPUT_FOLDER
-        )
+    existing_ids = scan_existing_ids(Config.OUTPUT_FOLDER)
+    asyncio.run(download_all(yt_api, playlist_url, stats, existing_ids, cache))
 
-        if success:
-            # Check if file was newly created or skipped
-            video_id = video.video_id
-            title = sanitize_filename(video.title)
-            filename = f"[{video_id}] - {title}.txt"
-            output_path = os.path.join(Config.OUTPUT_FOLDER, filename)
-
-            # If we just created it, it's a success; otherwise it was skipped earlier
-            if os.path.exists(output_path):
-                # Simple heuristic: if modified in last 5 seconds, we just created it
-                mod_time = os.path.getmtime(output_path)
-                if time.time() - mod_time < 5:
-                    stats.success += 1
-                else:
-                    stats.skipped += 1
-        else:
-            stats.failed += 1
+    if cache is not None:
+        cache.close()
 
     # Print summary
     logger.info("-" * 60)
@@ -319,4 +723,4 @@ if __name__ == "__main__":
     except KeyboardInterrupt:
         logger.warning("\n\nProcess interrupted by user. Exiting gracefully...")
     except Exception as e:
-        logger.error(f"\n\nUnexpected error: {e}", exc_info=True)
+        logger.error("\n\nUnexpected error: %s", e, exc_info=True)
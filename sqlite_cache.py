@@ -0,0 +1,83 @@
+"""
+SQLite-backed cache for transcripts and playlist listings.
+
+Persists raw transcript payloads and playlist (video_id, title) tuples
+across runs so repeated invocations (e.g. while tweaking formatting or
+languages) don't pay YouTube API latency again.
+"""
+
+import pickle
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transcripts (
+    video_id TEXT PRIMARY KEY,
+    fetched_at INTEGER NOT NULL,
+    payload BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS playlists (
+    url TEXT PRIMARY KEY,
+    fetched_at INTEGER NOT NULL,
+    payload BLOB NOT NULL
+);
+"""
+
+
+class TranscriptCache:
+    """
+    Thread-safe on-disk cache keyed by video ID / playlist URL.
+
+    Transcripts are effectively immutable so they never expire;
+    playlist listings expire after ttl_seconds since playlists
+    gain and lose videos over time.
+    """
+
+    def __init__(self, path: str, ttl_seconds: int):
+        self._ttl = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def get_transcript(self, video_id: str) -> Optional[object]:
+        """Return the cached transcript payload or None on miss."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload FROM transcripts WHERE video_id = ?", (video_id,)
+            ).fetchone()
+        return pickle.loads(row[0]) if row else None
+
+    def set_transcript(self, video_id: str, transcript_data: object):
+        """Store a fetched transcript payload."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO transcripts VALUES (?, ?, ?)",
+                (video_id, int(time.time()), pickle.dumps(transcript_data)),
+            )
+            self._conn.commit()
+
+    def get_playlist(self, url: str) -> Optional[list]:
+        """Return cached (video_id, title) tuples, or None on miss/expiry."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT fetched_at, payload FROM playlists WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None or time.time() - row[0] > self._ttl:
+            return None
+        return pickle.loads(row[1])
+
+    def set_playlist(self, url: str, videos: list):
+        """Store a playlist's (video_id, title) tuples."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO playlists VALUES (?, ?, ?)",
+                (url, int(time.time()), pickle.dumps(videos)),
+            )
+            self._conn.commit()
+
+    def close(self):
+        """Close the underlying database connection."""
+        self._conn.close()